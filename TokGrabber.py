@@ -21,6 +21,7 @@ Dependencies:
     - requests
     - tqdm
     - qdarkstyle
+    - orjson (optional, faster API response parsing)
 
 Make sure to place your "tiktok_logo.png" in the same directory as this script.
 Note: This script uses an unofficial API endpoint which may change or be discontinued.
@@ -31,18 +32,25 @@ import re
 import sys
 import csv
 import time
+import queue
+import atexit
+import threading
+from collections import OrderedDict
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from functools import partial
 from tqdm import tqdm
 
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSettings, QPoint, QUrl
-from PyQt5.QtGui import QIcon, QPixmap, QDesktopServices
+from PyQt5.QtCore import Qt, QObject, QThread, QTimer, pyqtSignal, pyqtSlot, QSettings, QPoint, QUrl
+from PyQt5.QtGui import QIcon, QPixmap, QPixmapCache, QDesktopServices, QTextCursor
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QLineEdit, QPushButton, QComboBox, QFileDialog, QProgressBar,
-    QTextEdit, QTabWidget, QFormLayout, QMessageBox, QDialog, QCheckBox,
-    QToolButton, QMenu, QTableWidget, QTableWidgetItem
+    QTextEdit, QPlainTextEdit, QTabWidget, QFormLayout, QMessageBox, QDialog, QCheckBox,
+    QToolButton, QMenu, QTableWidget, QTableWidgetItem, QSpinBox
 )
 
 try:
@@ -50,16 +58,54 @@ try:
 except ImportError:
     qdarkstyle = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# -------------------------
+# HTTP Session
+# -------------------------
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+WRITE_BUFFER_SIZE = 1024 * 1024
+SEGMENT_COUNT = 4
+SEGMENT_MIN_SIZE = 4 * 1024 * 1024
+
+def create_session(pool_size: int = 64) -> requests.Session:
+    """
+    Build a requests.Session with a pooled, retrying adapter so that repeated
+    hits to the API and CDN hosts reuse kept-alive connections. pool_size is
+    the number of connections kept alive per host.
+    """
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_size, pool_block=False, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def session_pool_size() -> int:
+    """Per-host pool size that fits the configured info-fetch and download concurrency."""
+    settings = QSettings("MyCompany", "TokGrabber")
+    fetch_workers = int(settings.value("concurrency", 16))
+    download_streams = int(settings.value("max_concurrent_downloads", 4)) * SEGMENT_COUNT
+    return max(fetch_workers, download_streams)
+
+_SESSION = create_session(session_pool_size())
+
 
 # -------------------------
 # Helper Functions
 # -------------------------
+_TIKTOK_RE = re.compile(r'(https?://)?(www\.)?(tiktok\.com|vm\.tiktok\.com|vt\.tiktok\.com)/')
+_SANITIZE_TABLE = str.maketrans("", "", '\\/*?:"<>|')
+
 def is_valid_tiktok_link(url: str) -> bool:
-    pattern = r'(https?://)?(www\.)?(tiktok\.com|vm\.tiktok\.com|vt\.tiktok\.com)/'
-    return re.match(pattern, url) is not None
+    return _TIKTOK_RE.match(url) is not None
 
 def sanitize_filename(filename: str) -> str:
-    return re.sub(r'[\\/*?:"<>|]', "", filename).strip()
+    return filename.translate(_SANITIZE_TABLE).strip()
 
 def format_duration(duration) -> str:
     try:
@@ -74,65 +120,298 @@ def format_duration(duration) -> str:
 def fetch_video_info(video_url: str) -> dict:
     api_endpoint = "https://tikwm.com/api"
     params = {"url": video_url, "hd": "1"}
-    for attempt in range(3):
-        try:
-            response = requests.get(api_endpoint, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            if attempt < 2:
-                time.sleep(2 ** attempt)
-            else:
-                raise e
+    response = _SESSION.get(api_endpoint, params=params, timeout=10)
+    response.raise_for_status()
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+INFO_CACHE_SIZE = 64
+INFO_CACHE_TTL = 300  # seconds
+_INFO_CACHE = OrderedDict()
+_INFO_CACHE_LOCK = threading.Lock()
+
+def get_video_info(video_url: str, refresh: bool = False) -> dict:
+    """
+    fetch_video_info backed by a small LRU cache of successful responses, so
+    a "Fetch Info" followed by "Download" only hits the API once.
+    """
+    now = time.monotonic()
+    with _INFO_CACHE_LOCK:
+        entry = _INFO_CACHE.get(video_url)
+        if entry is not None and not refresh and now - entry[0] < INFO_CACHE_TTL:
+            _INFO_CACHE.move_to_end(video_url)
+            return entry[1]
+    info = fetch_video_info(video_url)
+    if isinstance(info, dict) and info.get("code") == 0:
+        with _INFO_CACHE_LOCK:
+            _INFO_CACHE[video_url] = (now, info)
+            _INFO_CACHE.move_to_end(video_url)
+            while len(_INFO_CACHE) > INFO_CACHE_SIZE:
+                _INFO_CACHE.popitem(last=False)
+    return info
 
 def download_image_as_pixmap(url: str) -> QPixmap:
+    cached = QPixmapCache.find(url)
+    if cached is not None:
+        return cached
     try:
-        r = requests.get(url, timeout=10)
+        r = _SESSION.get(url, timeout=10)
         r.raise_for_status()
         pixmap = QPixmap()
         pixmap.loadFromData(r.content)
+        if not pixmap.isNull():
+            QPixmapCache.insert(url, pixmap)
         return pixmap
     except Exception:
         return QPixmap()
 
+class HistoryLogger:
+    """
+    Appends download history rows to the CSV file from a single background
+    thread. Rows queued within flush_interval of each other are written and
+    flushed together while the file stays open for the lifetime of the app.
+    """
+    def __init__(self, path: str = "download_history.csv", flush_interval: float = 1.0):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self.last_error = None
+
+    def append(self, row: list):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="HistoryLogger", daemon=True)
+                self._thread.start()
+        self._queue.put(row)
+
+    def flush(self, timeout: float = 5.0):
+        """Wait (at most timeout seconds) until every queued row has been handled."""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(done)  # Flush marker: write the pending batch right away
+        done.wait(timeout)
+
+    def _drain(self) -> list:
+        items = [self._queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+        while not isinstance(items[-1], threading.Event):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                items.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return items
+
+    def _run(self):
+        # History is best-effort: on I/O errors keep draining the queue and
+        # releasing flush markers so callers of flush() are never stuck.
+        csvfile = writer = None
+        try:
+            csvfile = open(self.path, "a", newline="", encoding="utf-8")
+            writer = csv.writer(csvfile)
+        except OSError as e:
+            self.last_error = e
+        while True:
+            items = self._drain()
+            rows = [item for item in items if not isinstance(item, threading.Event)]
+            if rows and writer is not None:
+                try:
+                    writer.writerows(rows)
+                    csvfile.flush()
+                except (OSError, csv.Error) as e:
+                    self.last_error = e
+            for item in items:
+                if isinstance(item, threading.Event):
+                    item.set()
+
+_HISTORY_LOGGER = HistoryLogger()
+atexit.register(_HISTORY_LOGGER.flush)
+
 def append_download_history(title: str, url: str, filepath: str, filesize: int):
-    history_file = "download_history.csv"
-    with open(history_file, "a", newline="", encoding="utf-8") as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow([datetime.now().isoformat(), title, url, filepath, filesize])
+    _HISTORY_LOGGER.append([datetime.now().isoformat(), title, url, filepath, filesize])
 
 
 # -------------------------
 # Worker Threads
 # -------------------------
-class DownloadWorker(QThread):
-    progress = pyqtSignal(int)
-    finished = pyqtSignal(str, int)  # filepath, filesize
-    error = pyqtSignal(str)
-    
-    def __init__(self, download_url: str, output_filename: str, parent=None):
-        super().__init__(parent)
+class QueuedFileWriter:
+    """
+    Writes chunks to a file object on a helper thread so that each disk write
+    overlaps the next network read. At most `depth` chunks are held in memory.
+    """
+    def __init__(self, f, depth: int = 2):
+        self._file = f
+        self._queue = queue.Queue(maxsize=depth)
+        self._error = None
+        self._closed = False
+        self.bytes_written = 0
+        self._thread = threading.Thread(target=self._run, name="QueuedFileWriter", daemon=True)
+        self._thread.start()
+
+    def write(self, chunk: bytes):
+        if self._error is not None:
+            raise self._error
+        self._queue.put(chunk)
+
+    def close(self):
+        """Wait for queued chunks to be written and re-raise any write error."""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self):
+        while True:
+            chunk = self._queue.get()
+            if chunk is None:
+                return
+            if self._error is None:
+                try:
+                    self._file.write(chunk)
+                    self.bytes_written += len(chunk)
+                except Exception as e:
+                    self._error = e
+
+class FileDownload:
+    """
+    Downloads one URL to a file on the calling thread. Used directly by the
+    batch download pool and wrapped by DownloadWorker for single downloads.
+    """
+    def __init__(self, download_url: str, output_filename: str, session: requests.Session = None):
         self.download_url = download_url
         self.output_filename = output_filename
-        self._paused = False
+        self.part_filename = output_filename + ".part"
+        self.session = session if session is not None else _SESSION
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        self._aborted = False
+        self._lock = threading.Lock()
+        self._downloaded = 0
+        self._total = 0
 
     def pause(self):
-        self._paused = True
+        self._resume_event.clear()
 
     def resume(self):
-        self._paused = False
-
-    def run(self):
+        self._resume_event.set()
+
+    def abort(self):
+        """Ask a running download to stop; run() then raises and drops the partial file."""
+        self._aborted = True
+        self._resume_event.set()  # A paused download must wake up to see the abort
+
+    def probe_segmented(self):
+        """
+        Return (url, size) if the server supports byte ranges for a file large
+        enough to be worth splitting across connections, else (None, 0).
+        """
+        if not hasattr(os, "pwrite"):
+            return None, 0
+        try:
+            probe = self.session.head(self.download_url, allow_redirects=True, timeout=10,
+                                     headers={"Accept-Encoding": "identity"})
+            probe.raise_for_status()
+            size = int(probe.headers.get("Content-Length", 0))
+        except Exception:
+            return None, 0
+        if probe.headers.get("Accept-Ranges", "").lower() != "bytes" or size < SEGMENT_MIN_SIZE:
+            return None, 0
+        return probe.url, size
+
+    def download_segment(self, fd: int, url: str, start: int, end: int):
+        headers = {"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"}
+        response = self.session.get(url, stream=True, timeout=30, headers=headers)
+        offset = start
+        with response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise IOError("Server ignored the range request.")
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                self._resume_event.wait()
+                if self._aborted:
+                    return
+                if chunk:
+                    os.pwrite(fd, chunk, offset)
+                    offset += len(chunk)
+                    self.add_progress(len(chunk))
+        if offset != end + 1:
+            raise IOError(f"Incomplete segment: got {offset - start} of {end - start + 1} bytes.")
+
+    def progress_snapshot(self):
+        """Return (downloaded, total) bytes; safe to poll from the GUI thread."""
+        with self._lock:
+            return self._downloaded, self._total
+
+    def set_progress(self, downloaded: int, total: int):
+        with self._lock:
+            self._downloaded = downloaded
+            self._total = total
+
+    def add_progress(self, nbytes: int):
+        with self._lock:
+            self._downloaded += nbytes
+
+    def download_segmented(self, url: str, size: int):
+        """
+        Fetch the file as SEGMENT_COUNT concurrent byte ranges written into a
+        temporary file that is renamed into place once every segment is done.
+        A partially written file cannot be resumed, so it is removed on failure.
+        """
+        step = -(-size // SEGMENT_COUNT)
+        ranges = [(start, min(start + step, size) - 1) for start in range(0, size, step)]
+        self.set_progress(0, size)
+        seg_filename = self.output_filename + ".seg"
+        fd = os.open(seg_filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
         try:
-            headers = {}
-            mode = "wb"
-            existing_size = 0
-            if os.path.exists(self.output_filename):
-                existing_size = os.path.getsize(self.output_filename)
-                headers["Range"] = f"bytes={existing_size}-"
-                mode = "ab"
-            response = requests.get(self.download_url, stream=True, timeout=30, headers=headers)
+            os.ftruncate(fd, size)
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                futures = [executor.submit(self.download_segment, fd, url, start, end) for start, end in ranges]
+                try:
+                    for future in futures:
+                        future.result()
+                except Exception:
+                    self.abort()
+                    raise
+            if self._aborted:
+                raise IOError("Download aborted.")
+        except Exception:
+            os.close(fd)
+            os.remove(seg_filename)
+            raise
+        os.close(fd)
+        os.replace(seg_filename, self.output_filename)
+
+    def run(self) -> int:
+        """Download the file, resuming a partial one, and return its size in bytes."""
+        if not os.path.exists(self.part_filename):
+            url, size = self.probe_segmented()
+            if url:
+                self.download_segmented(url, size)
+                return size
+        # Stream into a .part file that only ever holds contiguous received
+        # bytes, so its size is a valid resume offset even after a crash
+        headers = {}
+        mode = "wb"
+        existing_size = 0
+        if os.path.exists(self.part_filename):
+            existing_size = os.path.getsize(self.part_filename)
+            headers["Range"] = f"bytes={existing_size}-"
+            mode = "ab"
+        response = self.session.get(self.download_url, stream=True, timeout=30, headers=headers)
+        with response:
             response.raise_for_status()
+            if existing_size and response.status_code != 206:
+                # Server ignored the Range header and is sending the whole file
+                existing_size = 0
+                mode = "wb"
             total_size = response.headers.get("content-length")
             if total_size is None:
                 total_size = 0
@@ -142,20 +421,96 @@ class DownloadWorker(QThread):
                     total_size = int(response.headers.get("Content-Range").split("/")[-1])
             total = total_size
             downloaded = existing_size
-            with open(self.output_filename, mode) as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    while self._paused:
-                        time.sleep(0.2)
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if total > 0:
-                            percent = int((downloaded / total) * 100)
-                            self.progress.emit(percent)
-            self.finished.emit(self.output_filename, downloaded)
+            self.set_progress(downloaded, total)
+            with open(self.part_filename, mode, buffering=WRITE_BUFFER_SIZE) as f:
+                writer = QueuedFileWriter(f)
+                try:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        self._resume_event.wait()
+                        if self._aborted:
+                            break
+                        if chunk:
+                            writer.write(chunk)
+                            downloaded += len(chunk)
+                            self.add_progress(len(chunk))
+                finally:
+                    writer.close()
+        if self._aborted:
+            os.remove(self.part_filename)
+            raise IOError("Download aborted.")
+        os.replace(self.part_filename, self.output_filename)
+        return downloaded
+
+class DownloadWorker(QThread):
+    finished = pyqtSignal(str, int)  # filepath, filesize
+    error = pyqtSignal(str)
+    
+    def __init__(self, download_url: str, output_filename: str, session: requests.Session = None, parent=None):
+        super().__init__(parent)
+        self.download = FileDownload(download_url, output_filename, session)
+
+    def pause(self):
+        self.download.pause()
+
+    def resume(self):
+        self.download.resume()
+
+    def progress_snapshot(self):
+        return self.download.progress_snapshot()
+
+    def run(self):
+        try:
+            size = self.download.run()
+            self.finished.emit(self.download.output_filename, size)
         except Exception as e:
             self.error.emit(str(e))
 
+class BatchDownloadPool(QObject):
+    """
+    Runs batch downloads on a bounded thread pool. Signals are emitted from
+    pool threads and delivered to GUI-thread slots as queued calls.
+    """
+    item_finished = pyqtSignal(str, str, int)  # video_url, filepath, filesize
+    item_error = pyqtSignal(str, str)  # video_url, error message
+
+    def __init__(self, max_workers: int, session: requests.Session = None, parent=None):
+        super().__init__(parent)
+        self.session = session if session is not None else _SESSION
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="BatchDownload")
+        self._active = set()
+        self._active_lock = threading.Lock()
+        self._cancelled = False
+
+    def submit(self, video_url: str, download_url: str, output_filename: str):
+        self._executor.submit(self._download, video_url, download_url, output_filename)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+    def cancel(self):
+        """Drop queued items and abort the ones in flight without waiting for them."""
+        self._cancelled = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._active_lock:
+            for download in self._active:
+                download.abort()
+
+    def _download(self, video_url: str, download_url: str, output_filename: str):
+        download = FileDownload(download_url, output_filename, self.session)
+        with self._active_lock:
+            if self._cancelled:
+                return
+            self._active.add(download)
+        try:
+            size = download.run()
+            self.item_finished.emit(video_url, output_filename, size)
+        except Exception as e:
+            if not self._cancelled:
+                self.item_error.emit(video_url, str(e))
+        finally:
+            with self._active_lock:
+                self._active.discard(download)
+
 class FetchInfoWorker(QThread):
     finished = pyqtSignal(dict)
     error = pyqtSignal(str)
@@ -166,15 +521,64 @@ class FetchInfoWorker(QThread):
         
     def run(self):
         try:
-            info = fetch_video_info(self.video_url)
+            info = get_video_info(self.video_url, refresh=True)
             self.finished.emit(info)
         except Exception as e:
             self.error.emit(str(e))
 
+class BatchInfoWorker(QThread):
+    """
+    Resolves video info for a list of URLs concurrently on a thread pool,
+    emitting one signal per URL as soon as its API call completes.
+    """
+    resolved = pyqtSignal(str, dict)  # video_url, info
+    error = pyqtSignal(str, str)  # video_url, error message
+
+    def __init__(self, video_urls: list, max_workers: int = 16, parent=None):
+        super().__init__(parent)
+        self.video_urls = video_urls
+        self.max_workers = max(1, max_workers)
+        self._executor = None
+        self._cancelled = False
+
+    def cancel(self):
+        """Drop lookups that have not started; run() returns once in-flight ones end."""
+        self._cancelled = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def run(self):
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(fetch_video_info, url): url for url in self.video_urls}
+            self._executor = executor
+            if self._cancelled:
+                executor.shutdown(wait=False, cancel_futures=True)
+            for future in as_completed(futures):
+                if self._cancelled:
+                    break
+                video_url = futures[future]
+                try:
+                    info = future.result()
+                except Exception as e:
+                    self.error.emit(video_url, str(e))
+                    continue
+                self.resolved.emit(video_url, info)
+
 
 # -------------------------
 # Custom Title Bar
 # -------------------------
+_LOGO_PIXMAP = None
+_LOGO_PIXMAP_SMALL = None
+
+def logo_pixmap(small: bool = False) -> QPixmap:
+    """Decode tiktok_logo.png once and reuse it (and its 40x40 variant)."""
+    global _LOGO_PIXMAP, _LOGO_PIXMAP_SMALL
+    if _LOGO_PIXMAP is None:
+        _LOGO_PIXMAP = QPixmap("tiktok_logo.png")
+        _LOGO_PIXMAP_SMALL = _LOGO_PIXMAP.scaled(40, 40, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    return _LOGO_PIXMAP_SMALL if small else _LOGO_PIXMAP
+
 class CustomTitleBar(QWidget):
     """
     A custom title bar that includes:
@@ -195,8 +599,7 @@ class CustomTitleBar(QWidget):
 
         # TikTok Logo
         self.logo_label = QLabel()
-        pixmap = QPixmap("tiktok_logo.png")
-        self.logo_label.setPixmap(pixmap.scaled(40, 40, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        self.logo_label.setPixmap(logo_pixmap(small=True))
         layout.addWidget(self.logo_label)
 
         # Title Label (TokGrabber)
@@ -285,11 +688,19 @@ class SettingsDialog(QDialog):
         self.timeout_edit = QLineEdit(self.settings.value("timeout", "10"))
         self.verbose_checkbox = QCheckBox("Verbose Logging")
         self.verbose_checkbox.setChecked(self.settings.value("verbose", "false") == "true")
+        self.concurrency_spin = QSpinBox()
+        self.concurrency_spin.setRange(1, 64)
+        self.concurrency_spin.setValue(int(self.settings.value("concurrency", 16)))
+        self.max_downloads_spin = QSpinBox()
+        self.max_downloads_spin.setRange(1, 16)
+        self.max_downloads_spin.setValue(int(self.settings.value("max_concurrent_downloads", 4)))
         self.theme_combo = QComboBox()
         self.theme_combo.addItems(["Dark", "Light"])
 
         layout.addRow("Default Output Directory:", self.output_dir_edit)
         layout.addRow("Network Timeout (sec):", self.timeout_edit)
+        layout.addRow("Batch Info Fetch Concurrency:", self.concurrency_spin)
+        layout.addRow("Max Concurrent Downloads:", self.max_downloads_spin)
         layout.addRow("", self.verbose_checkbox)
         layout.addRow("Theme:", self.theme_combo)
 
@@ -306,6 +717,8 @@ class SettingsDialog(QDialog):
     def accept(self):
         self.settings.setValue("output_dir", self.output_dir_edit.text())
         self.settings.setValue("timeout", self.timeout_edit.text())
+        self.settings.setValue("concurrency", self.concurrency_spin.value())
+        self.settings.setValue("max_concurrent_downloads", self.max_downloads_spin.value())
         self.settings.setValue("verbose", "true" if self.verbose_checkbox.isChecked() else "false")
         self.settings.setValue("theme", self.theme_combo.currentText())
         super().accept()
@@ -314,6 +727,10 @@ class SettingsDialog(QDialog):
 # -------------------------
 # Main GUI Window
 # -------------------------
+LOG_MAX_BLOCKS = 5000  # Oldest log lines are dropped beyond this
+BATCH_SUMMARY_THRESHOLD = 50  # Larger batches log a summary instead of per-item lines
+BATCH_SUMMARY_MAX_ERRORS = 20
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -321,11 +738,25 @@ class MainWindow(QMainWindow):
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.resize(800, 600)
         self.setWindowTitle("TokGrabber")
-        self.setWindowIcon(QIcon("tiktok_logo.png"))
+        self.setWindowIcon(QIcon(logo_pixmap()))
 
         self.settings = QSettings("MyCompany", "TokGrabber")
-
-        self.statusBar().showMessage("Ready")
+        # Room for a few dozen decoded cover images (KB)
+        QPixmapCache.setCacheLimit(64 * 1024)
+
+        self.status_bar = self.statusBar()
+        self.status_bar.showMessage("Ready")
+
+        # One 100 ms timer, created once, drives every deferred GUI update:
+        # buffered log lines, the single download bar and the batch bar.
+        # It only runs while one of those has work pending (see schedule_ui_tick)
+        self._log_buf = []
+        self._batch_log_buf = []
+        self.download_polling = False
+        self.batch_running = False
+        self.ui_timer = QTimer(self)
+        self.ui_timer.setInterval(100)
+        self.ui_timer.timeout.connect(self.on_ui_tick)
 
         # Main widget and layout
         main_widget = QWidget()
@@ -425,6 +856,7 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(self.progress_bar)
         self.log_area = QTextEdit()
         self.log_area.setReadOnly(True)
+        self.log_area.document().setMaximumBlockCount(LOG_MAX_BLOCKS)
         main_layout.addWidget(self.log_area)
         self.single_tab.setLayout(main_layout)
 
@@ -461,11 +893,15 @@ class MainWindow(QMainWindow):
         layout.addLayout(form_layout)
         self.batch_progress_bar = QProgressBar()
         layout.addWidget(self.batch_progress_bar)
-        self.batch_log_area = QTextEdit()
+        self.batch_log_area = QPlainTextEdit()
         self.batch_log_area.setReadOnly(True)
+        self.batch_log_area.setMaximumBlockCount(LOG_MAX_BLOCKS)
+        self.batch_log_area.setStyleSheet("QPlainTextEdit { color: #00BFFF; }")
         layout.addWidget(self.batch_log_area)
         self.batch_tab.setLayout(layout)
-        self.batch_workers = []
+        self.batch_pool = None
+        self.batch_session = None
+        self.batch_info_worker = None
 
     # -------------------------
     # Download History Tab
@@ -486,16 +922,27 @@ class MainWindow(QMainWindow):
         self.load_history()
 
     def load_history(self):
+        _HISTORY_LOGGER.flush()
         self.history_table.setRowCount(0)
         history_file = "download_history.csv"
         if os.path.exists(history_file):
             with open(history_file, "r", encoding="utf-8") as csvfile:
-                reader = csv.reader(csvfile)
-                for row in reader:
-                    row_position = self.history_table.rowCount()
-                    self.history_table.insertRow(row_position)
+                rows = list(csv.reader(csvfile))
+            # Populate in one pass with repaints and signals suspended
+            table = self.history_table
+            sorting = table.isSortingEnabled()
+            table.setSortingEnabled(False)
+            table.setUpdatesEnabled(False)
+            table.blockSignals(True)
+            try:
+                table.setRowCount(len(rows))
+                for row_position, row in enumerate(rows):
                     for col, item in enumerate(row):
-                        self.history_table.setItem(row_position, col, QTableWidgetItem(item))
+                        table.setItem(row_position, col, QTableWidgetItem(item))
+            finally:
+                table.blockSignals(False)
+                table.setUpdatesEnabled(True)
+                table.setSortingEnabled(sorting)
         else:
             self.history_table.setRowCount(0)
             self.history_table.insertRow(0)
@@ -516,6 +963,19 @@ class MainWindow(QMainWindow):
                 folder = os.path.dirname(file_path)
                 QDesktopServices.openUrl(QUrl.fromLocalFile(folder))
 
+    def closeEvent(self, event):
+        # Pool threads are not daemons, so without this the process would
+        # keep downloading the rest of a batch after the window is gone
+        if self.batch_info_worker is not None:
+            self.batch_info_worker.cancel()
+            self.batch_info_worker.wait()
+        if self.batch_pool is not None:
+            self.batch_pool.cancel()
+            self.batch_pool = None
+        self.batch_running = False
+        self.close_batch_session()
+        super().closeEvent(event)
+
     def on_tab_changed(self, index):
         if self.tabs.tabText(index) == "Download History":
             self.load_history()
@@ -524,12 +984,49 @@ class MainWindow(QMainWindow):
     # Utility Methods
     # -------------------------
     def log(self, message: str):
-        self.log_area.append(f'<span style="color: #00BFFF;">{message}</span>')
-        self.statusBar().showMessage(message, 5000)
-
-    def batch_log(self, message: str):
-        self.batch_log_area.append(f'<span style="color: #00BFFF;">{message}</span>')
-        self.statusBar().showMessage(message, 5000)
+        self._log_buf.append(message)
+        self.schedule_ui_tick()
+        self.status_bar.showMessage(message, 5000)
+
+    def batch_log(self, message: str, status: bool = False):
+        # Only batch milestones reach the status bar; per-item lines stay in the log
+        self._batch_log_buf.append(message)
+        self.schedule_ui_tick()
+        if status:
+            self.status_bar.showMessage(message, 5000)
+
+    def schedule_ui_tick(self):
+        if not self.ui_timer.isActive():
+            self.ui_timer.start()
+
+    def on_ui_tick(self):
+        if self.download_polling:
+            self.update_download_progress()
+        if self.batch_running:
+            self.flush_batch_progress()
+        self.flush_logs()
+        if not (self.download_polling or self.batch_running):
+            self.ui_timer.stop()
+
+    def flush_logs(self):
+        if self._log_buf:
+            self.append_log_lines(self.log_area, self._log_buf)
+            self._log_buf = []
+        if self._batch_log_buf:
+            self.batch_log_area.appendPlainText("\n".join(self._batch_log_buf))
+            self._batch_log_buf = []
+
+    def append_log_lines(self, area: QTextEdit, messages: list):
+        # One edit block per flush so the document is laid out once, not per line
+        cursor = QTextCursor(area.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        for message in messages:
+            if not area.document().isEmpty():
+                cursor.insertBlock()
+            cursor.insertHtml(f'<span style="color: #00BFFF;">{message}</span>')
+        cursor.endEditBlock()
+        area.moveCursor(QTextCursor.End)
 
     def browse_output_dir(self):
         directory = QFileDialog.getExistingDirectory(self, "Select Output Directory", os.getcwd())
@@ -549,6 +1046,7 @@ class MainWindow(QMainWindow):
     def export_logs(self):
         fname, _ = QFileDialog.getSaveFileName(self, "Export Logs", "logs.txt", "Text Files (*.txt);;All Files (*)")
         if fname:
+            self.flush_logs()
             with open(fname, "w", encoding="utf-8") as f:
                 f.write(self.log_area.toPlainText())
             QMessageBox.information(self, "Export Logs", "Logs exported successfully.")
@@ -580,9 +1078,12 @@ class MainWindow(QMainWindow):
         self.log("Fetching video info...")
         self.fetch_worker = FetchInfoWorker(url)
         self.fetch_worker.finished.connect(self.on_info_fetched)
-        self.fetch_worker.error.connect(lambda err: self.log("Error: " + err))
+        self.fetch_worker.error.connect(self.on_fetch_error)
         self.fetch_worker.start()
 
+    def on_fetch_error(self, err: str):
+        self.log("Error: " + err)
+
     def on_info_fetched(self, info: dict):
         if not isinstance(info, dict) or info.get("code") != 0 or "data" not in info:
             self.log("Invalid API response.")
@@ -620,7 +1121,7 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Invalid URL", "This does not appear to be a valid TikTok URL.")
             return
         try:
-            info = fetch_video_info(url)
+            info = get_video_info(url)
         except Exception as e:
             QMessageBox.critical(self, "Error", "Error fetching info: " + str(e))
             return
@@ -661,17 +1162,34 @@ class MainWindow(QMainWindow):
                 self.log("Download cancelled: file already exists.")
                 return
         self.log("Starting download...")
-        self.download_worker = DownloadWorker(download_url, output_filename)
-        self.download_worker.progress.connect(lambda p: self.progress_bar.setValue(p))
+        self.download_worker = DownloadWorker(download_url, output_filename, _SESSION)
+        # Carried on the worker so the slot records what was downloaded, not what the inputs show now
+        self.download_worker.setProperty("url", url)
+        self.download_worker.setProperty("title", title)
         self.download_worker.finished.connect(self.on_download_finished)
-        self.download_worker.error.connect(lambda err: self.log("Download error: " + err))
+        self.download_worker.error.connect(self.on_download_error)
         self.pause_button.setEnabled(True)
+        self.progress_bar.setValue(0)
         self.download_worker.start()
+        self.download_polling = True
+        self.schedule_ui_tick()
+
+    def update_download_progress(self):
+        downloaded, total = self.download_worker.progress_snapshot()
+        if total > 0:
+            self.progress_bar.setValue(int((downloaded / total) * 100))
+
+    def on_download_error(self, err: str):
+        self.download_polling = False
+        self.log("Download error: " + err)
 
+    @pyqtSlot(str, int)
     def on_download_finished(self, filepath: str, filesize: int):
+        self.download_polling = False
+        self.update_download_progress()
         self.log("Download complete: " + filepath)
-        append_download_history(self.title_label.text().replace("Title: ", ""),
-                                self.url_input.text().strip(), filepath, filesize)
+        worker = self.sender()
+        append_download_history(worker.property("title"), worker.property("url"), filepath, filesize)
 
     def toggle_pause(self):
         if hasattr(self, "download_worker"):
@@ -688,9 +1206,12 @@ class MainWindow(QMainWindow):
     # Batch Download Actions
     # -------------------------
     def start_batch_download(self):
+        if self.batch_running:
+            self.batch_log("A batch download is already running.", status=True)
+            return
         batch_file = self.batch_file_input.text().strip()
         if not batch_file or not os.path.exists(batch_file):
-            self.batch_log("Please select a valid URLs file.")
+            self.batch_log("Please select a valid URLs file.", status=True)
             return
         output_dir = self.batch_output_dir_input.text().strip()
         download_type = self.batch_download_type.currentText()
@@ -701,81 +1222,170 @@ class MainWindow(QMainWindow):
             "Music": ("music", ".mp3")
         }
         if download_type not in options:
-            self.batch_log("Invalid download type selected.")
+            self.batch_log("Invalid download type selected.", status=True)
             return
         key, file_ext = options[download_type]
         with open(batch_file, "r", encoding="utf-8") as f:
             urls = [line.strip() for line in f if line.strip()]
         valid_urls = [url for url in urls if is_valid_tiktok_link(url)]
         if not valid_urls:
-            self.batch_log("No valid TikTok URLs found in the file.")
+            self.batch_log("No valid TikTok URLs found in the file.", status=True)
             return
+        # Drop repeated URLs, keeping the first occurrence's position
+        unique_urls = list(dict.fromkeys(valid_urls))
+        duplicates = len(valid_urls) - len(unique_urls)
+        if duplicates:
+            self.batch_log(f"Skipped {duplicates} duplicate URLs.")
+        valid_urls = unique_urls
         self.batch_total = len(valid_urls)
         self.batch_completed = 0
+        self.batch_succeeded = 0
+        self.batch_failures = []
+        self.batch_summary_mode = self.batch_total > BATCH_SUMMARY_THRESHOLD
+        self._last_percent = 0
         self.batch_progress_bar.setValue(0)
-        self.batch_workers = []
-        for idx, video_url in enumerate(valid_urls, start=1):
-            self.batch_log(f"Processing video {idx} of {self.batch_total}")
-            try:
-                info = fetch_video_info(video_url)
-            except Exception as e:
-                self.batch_log(f"Error fetching info for URL {video_url}: {e}")
-                self.increment_batch_progress()
-                continue
-            if not isinstance(info, dict) or info.get("code") != 0 or "data" not in info:
-                self.batch_log(f"Invalid API response for URL {video_url}")
-                self.increment_batch_progress()
-                continue
-            data = info["data"]
-            title = data.get("title", f"untitled_{idx}")
-            sanitized_title = sanitize_filename(title)
-            download_url = data.get(key)
-            if not download_url:
-                self.batch_log(f"Media for {download_type} not available for URL {video_url}")
-                self.increment_batch_progress()
-                continue
-            output_filename = os.path.join(output_dir, sanitized_title + file_ext)
-            if os.path.exists(output_filename):
-                self.batch_log(f"File {output_filename} already exists. Skipping download.")
-                self.increment_batch_progress()
-                continue
-            self.batch_log(f"Downloading: {output_filename}")
-            worker = DownloadWorker(download_url, output_filename)
-            worker.progress.connect(lambda p, url=video_url: self.batch_log(f"Progress for {url}: {p}%"))
-            worker.finished.connect(lambda f, url=video_url: self.on_batch_item_complete(url, f))
-            worker.error.connect(lambda err, url=video_url: self.on_batch_item_error(url, err))
-            worker.start()
-            self.batch_workers.append(worker)
-
-    def on_batch_item_complete(self, url, filename):
-        self.batch_log(f"Download complete for {url}: {filename}")
+        self.batch_key = key
+        self.batch_file_ext = file_ext
+        self.batch_type = download_type
+        self.batch_output_dir = output_dir
+        self.batch_indices = {url: idx for idx, url in enumerate(valid_urls, start=1)}
+        # One directory scan instead of a stat per URL; queued names are added as we go
+        try:
+            with os.scandir(output_dir) as entries:
+                self.batch_existing = {os.path.normcase(entry.name) for entry in entries}
+        except OSError:
+            self.batch_existing = set()
+        self.release_batch_pool()
+        # One keep-alive session per batch, sized for the current download settings
+        max_downloads = int(self.settings.value("max_concurrent_downloads", 4))
+        self.batch_session = create_session(max_downloads * SEGMENT_COUNT)
+        self.batch_pool = BatchDownloadPool(max_downloads, self.batch_session, self)
+        # Queued so pool-thread emissions always run on the GUI thread, unique so each fires once
+        connection = Qt.QueuedConnection | Qt.UniqueConnection
+        self.batch_pool.item_finished.connect(self.on_batch_item_complete, connection)
+        self.batch_pool.item_error.connect(self.on_batch_item_error, connection)
+        self.batch_log(f"Fetching info for {self.batch_total} videos...", status=True)
+        self.batch_info_worker = BatchInfoWorker(valid_urls, int(self.settings.value("concurrency", 16)))
+        self.batch_info_worker.resolved.connect(self.on_batch_info_resolved, connection)
+        self.batch_info_worker.error.connect(self.on_batch_info_error, connection)
+        self.batch_info_worker.finished.connect(self.on_batch_info_worker_done)
+        self.batch_info_worker.start()
+        self.batch_running = True
+        self.batch_download_button.setEnabled(False)
+        self.schedule_ui_tick()
+
+    def on_batch_info_worker_done(self):
+        # Release the finished QThread instead of keeping it until the next batch
+        worker = self.sender()
+        worker.deleteLater()
+        if worker is self.batch_info_worker:
+            self.batch_info_worker = None
+
+    @pyqtSlot(str, str)
+    def on_batch_info_error(self, video_url: str, err: str):
+        self.batch_indices.pop(video_url, None)
+        self.batch_item_failed(f"Error fetching info for URL {video_url}: {err}")
+
+    @pyqtSlot(str, dict)
+    def on_batch_info_resolved(self, video_url: str, info: dict):
+        idx = self.batch_indices.pop(video_url, 0)
+        self.batch_item_log(f"Processing video {idx} of {self.batch_total}")
+        if not isinstance(info, dict) or info.get("code") != 0 or "data" not in info:
+            self.batch_item_failed(f"Invalid API response for URL {video_url}")
+            return
+        data = info["data"]
+        title = data.get("title", f"untitled_{idx}")
+        sanitized_title = sanitize_filename(title)
+        download_url = data.get(self.batch_key)
+        if not download_url:
+            self.batch_item_failed(f"Media for {self.batch_type} not available for URL {video_url}")
+            return
+        output_name = sanitized_title + self.batch_file_ext
+        output_filename = os.path.join(self.batch_output_dir, output_name)
+        if os.path.normcase(output_name) in self.batch_existing:
+            self.batch_item_log(f"File {output_filename} already exists. Skipping download.")
+            self.increment_batch_progress()
+            return
+        self.batch_existing.add(os.path.normcase(output_name))
+        self.batch_item_log(f"Downloading: {output_filename}")
+        self.batch_pool.submit(video_url, download_url, output_filename)
+
+    @pyqtSlot(str, str, int)
+    def on_batch_item_complete(self, url: str, filename: str, filesize: int):
+        self.batch_succeeded += 1
+        self.batch_item_log(f"Download complete for {url}: {filename}")
         self.increment_batch_progress()
 
-    def on_batch_item_error(self, url, err):
-        self.batch_log(f"Download error for {url}: {err}")
+    @pyqtSlot(str, str)
+    def on_batch_item_error(self, url: str, err: str):
+        self.batch_item_failed(f"Download error for {url}: {err}")
+
+    def batch_item_log(self, message: str):
+        # Per-item lines are dropped for large batches; see log_batch_summary
+        if not self.batch_summary_mode:
+            self.batch_log(message)
+
+    def batch_item_failed(self, message: str):
+        self.batch_failures.append(message)
+        self.batch_item_log(message)
         self.increment_batch_progress()
 
+    def log_batch_summary(self):
+        failed = len(self.batch_failures)
+        skipped = self.batch_total - self.batch_succeeded - failed
+        self.batch_log(f"Done: {self.batch_succeeded} downloaded, {skipped} skipped, {failed} failed.")
+        if self.batch_summary_mode and failed:
+            for message in self.batch_failures[:BATCH_SUMMARY_MAX_ERRORS]:
+                self.batch_log(message)
+            if failed > BATCH_SUMMARY_MAX_ERRORS:
+                self.batch_log(f"... and {failed - BATCH_SUMMARY_MAX_ERRORS} more errors.")
+
+    def release_batch_pool(self):
+        # Let the pool threads exit and free the pool once its batch is done
+        if self.batch_pool is not None:
+            self.batch_pool.shutdown()
+            self.batch_pool.deleteLater()
+            self.batch_pool = None
+
+    def close_batch_session(self):
+        # Only safe once every item has reported back and no request is in flight
+        if self.batch_session is not None:
+            self.batch_session.close()
+            self.batch_session = None
+
     def increment_batch_progress(self):
         self.batch_completed += 1
-        percent = int((self.batch_completed / self.batch_total) * 100)
-        self.batch_progress_bar.setValue(percent)
 
-    def batch_log(self, message: str):
-        self.batch_log_area.append(f'<span style="color: #00BFFF;">{message}</span>')
-        self.statusBar().showMessage(message, 5000)
+    def flush_batch_progress(self):
+        completed, total = self.batch_completed, self.batch_total
+        percent = (completed * 100) // total
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.batch_progress_bar.setValue(percent)
+        if completed >= total:
+            self.batch_running = False
+            self.batch_download_button.setEnabled(True)
+            self.release_batch_pool()
+            self.close_batch_session()
+            self.log_batch_summary()
+            self.batch_log("Batch download finished.", status=True)
 
 # -------------------------
 # Main Execution
 # -------------------------
+FALLBACK_STYLESHEET = "QMainWindow { background-color: #2E2E2E; }"
+
 if __name__ == "__main__":
+    # Must be set before the QApplication is created
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
     app = QApplication(sys.argv)
+    # qdarkstyle patches the application palette, so it needs the QApplication to exist
     if qdarkstyle is not None:
         app.setStyleSheet(qdarkstyle.load_stylesheet_pyqt5())
     else:
-        fallback_theme = "QMainWindow { background-color: #2E2E2E; }"
-        app.setStyleSheet(fallback_theme)
+        app.setStyleSheet(FALLBACK_STYLESHEET)
 
     window = MainWindow()
-    window.tabs.currentChanged.connect(window.on_tab_changed)
     window.show()
-    sys.exit(app.exec_())
\ No newline at end of file
+    sys.exit(app.exec())
\ No newline at end of file